@@ -1,9 +1,31 @@
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
-import math
 from figure_utils import create_building_collection_figure
 from report_utils import generate_csv_report, generate_odt_report
+from risk_utils import (
+    collection_area,
+    threat_from_area,
+    combined_coefficient,
+    tolerable_frequency_from_coefficient,
+    max_height,
+    max_length,
+    max_footprint,
+    max_coefficient_product,
+    solve_lps_limits,
+    invalid_structures,
+    NG_CONVERSION,
+    LENGTH_COLUMN,
+    WIDTH_COLUMN,
+    HEIGHT_COLUMN,
+    NG_COLUMN,
+    C_2_COLUMN,
+    C_3_COLUMN,
+    C_4_COLUMN,
+    C_5_COLUMN,
+    C_D_COLUMN,
+)
+from scenario_utils import INPUT_COLUMNS, compute_scenario, update_scenario, compare_scenarios
 import pandas as pd
 
 flash_density_map_url = "https://www.vaisala.com/sites/default/files/2020-09/Lightning/NLDN/LIFT-WEA-Lightning-NLDN-Map3-650x365.jpg"
@@ -133,7 +155,7 @@ with cols[0]:
     w_m = w * 0.3048  # feet to meters
     h_m = h * 0.3048  # feet to meters
     # Calculate the collection area (A) in m²
-    A_D = l_m * w_m + 6 * h_m * (l_m + w_m) + 9 * math.pi * h_m * h_m # Collection area in m²
+    A_D = float(collection_area(l, w, h)) # Collection area in m²
     st.write(f"**Collection Area:** {A_D:.2f} m²")
     st.latex(r"A = l \times w + 6h(l + w) + 9\pi h^2 = \\{:.2f} \, \text{{m}} \times {:.2f} \, \text{{m}} + 6 \times {:.2f} \, \text{{m}} \, ( {:.2f} \, \text{{m}} + {:.2f} \, \text{{m}} ) + 9\pi \times ( {:.2f} \, \text{{m}} )^2 =\\ {:.2f} \, \text{{m}}^2".format(l_m, w_m, h_m, l_m, w_m, h_m, A_D))
     if metric_fig_selection == "Imperial (ft)":
@@ -281,16 +303,16 @@ with cols[1]:
     C_5 = lighting_consequence_coefficients[C_5]
 
 Ng = flash_ranges[Ng]  # Convert selected range to numeric value
-Ng_m2 = Ng * 0.386102  # Convert flashes/sq miles/year to flashes/sq km/year
+Ng_m2 = Ng * NG_CONVERSION  # Convert flashes/sq miles/year to flashes/sq km/year
 
 # Calculate the expected annual threat occurrence (N_D)
-N_D = Ng_m2 * A_D * C_D * 10**-6
+N_D = float(threat_from_area(Ng, A_D, C_D))
 
 # Calculate the combined coefficient (C)
-C = C_2 * C_3 * C_4 * C_5
+C = float(combined_coefficient(C_2, C_3, C_4, C_5))
 
 # Calculate the tolerable lightning frequency (N_c)
-N_c = 1.5 * 10**-3 / C
+N_c = float(tolerable_frequency_from_coefficient(C))
 
 # If N_D <= N_c, a Lightning Protection System (LPS) is optional
 # If N_D > N_c, an LPS is recommended
@@ -433,6 +455,160 @@ with cols[1]:
         mime="application/vnd.oasis.opendocument.text"
     )
 
+st.markdown("---")
+st.markdown("## Maximum Allowable Values")
+st.markdown("""
+Limits at which a Lightning Protection System (LPS) remains optional, solved directly from $N_D = N_c$ for the current inputs.
+""")
+h_max = float(max_height(l, w, Ng, C_D, C_2, C_3, C_4, C_5))
+l_max = float(max_length(w, h, Ng, C_D, C_2, C_3, C_4, C_5))
+A_fp_max = float(max_footprint(l, w, h, Ng, C_D, C_2, C_3, C_4, C_5))
+C_max = float(max_coefficient_product(l, w, h, Ng, C_D))
+cols = st.columns(4)
+with cols[0]:
+    if np.isnan(h_max):
+        st.write("**Maximum Height:** not achievable, the footprint alone exceeds the tolerable collection area")
+    else:
+        st.write(f"**Maximum Height:** {h_max:.2f} ft ({h_max * 0.3048:.2f} m)")
+with cols[1]:
+    if np.isnan(l_max):
+        st.write("**Maximum Length (width and height fixed):** not achievable for the current width and height")
+    else:
+        st.write(f"**Maximum Length (width and height fixed):** {l_max:.2f} ft ({l_max * 0.3048:.2f} m)")
+with cols[2]:
+    if np.isnan(A_fp_max):
+        st.write("**Maximum Footprint:** not achievable, the height alone exceeds the tolerable collection area")
+    else:
+        st.write(f"**Maximum Footprint (same proportions):** {A_fp_max:.2f} ft² ({A_fp_max * 0.3048**2:.2f} m²)")
+with cols[3]:
+    st.write(f"**Maximum Combined Coefficient:** {C_max:.2f}")
+    st.latex(r"C_{{max}} = \frac{{1.5 \times 10^{{-3}}}}{{N_D}} = \frac{{1.5 \times 10^{{-3}}}}{{{:.6f}}} = {:.2f}".format(N_D, C_max))
+
+st.markdown("##### Portfolio Screening (optional)")
+portfolio_file = st.file_uploader(
+    "Upload Portfolio Data (optional)",
+    type=["csv"],
+    key="portfolio_key",
+    help="Upload a CSV file with one structure per row to calculate the maximum allowable values for every structure. The file should have columns: 'Length (ft)', 'Width (ft)', 'Height (ft)', 'Ground Flash Density (flashes/sq miles/year)', 'Construction Coefficient', 'Contents Coefficient', 'Occupancy Coefficient', 'Consequence Coefficient', 'Location Coefficient'."
+)
+portfolio_df = None
+if portfolio_file:
+    portfolio_df = pd.read_csv(portfolio_file)
+    portfolio_columns = [
+        LENGTH_COLUMN,
+        WIDTH_COLUMN,
+        HEIGHT_COLUMN,
+        NG_COLUMN,
+        C_2_COLUMN,
+        C_3_COLUMN,
+        C_4_COLUMN,
+        C_5_COLUMN,
+        C_D_COLUMN,
+    ]
+    if all(col in portfolio_df.columns for col in portfolio_columns):
+        # Accept the ground flash density range labels used by the selectbox above
+        portfolio_df[NG_COLUMN] = portfolio_df[NG_COLUMN].map(lambda value: flash_ranges.get(value, value))
+        try:
+            portfolio_df[portfolio_columns] = portfolio_df[portfolio_columns].astype(float)
+        except ValueError:
+            portfolio_df = None
+            st.error("Uploaded CSV file contains non-numeric values in the required columns. Please check the file format.")
+        else:
+            invalid_rows = invalid_structures(portfolio_df)
+            if invalid_rows.any():
+                row_numbers = ", ".join(str(i + 1) for i in np.flatnonzero(invalid_rows))
+                portfolio_df = None
+                st.error(f"Uploaded CSV file contains blank values, dimensions below 1 ft, or non-positive coefficients in rows: {row_numbers}. Please check the file format.")
+    else:
+        portfolio_df = None
+        st.error("Uploaded CSV file does not contain the required columns. Please check the file format.")
+    if portfolio_df is not None:
+        portfolio_limits = solve_lps_limits(portfolio_df)
+        st.dataframe(portfolio_limits)
+        st.download_button(
+            label="Download Portfolio Limits CSV",
+            data=portfolio_limits.to_csv(index=False).encode('utf-8'),
+            file_name=f"{project_name}_lightning_risk_limits_{now}.csv",
+            mime="text/csv"
+        )
+
+st.markdown("---")
+st.markdown("## Scenario Comparison")
+st.markdown("""
+Save named variants of the assessment (or of the uploaded portfolio) and compare them side by side.
+Editing a coefficient only recomputes the results that depend on it.
+""")
+
+if "scenarios" not in st.session_state:
+    st.session_state.scenarios = {}
+
+cols = st.columns(2, vertical_alignment="bottom")
+with cols[0]:
+    scenario_name = st.text_input("Scenario Name", placeholder="Enter scenario name here")
+with cols[1]:
+    scenario_sources = ["Current Assessment"]
+    if portfolio_df is not None:
+        scenario_sources.append("Uploaded Portfolio")
+    scenario_source = st.radio("Scenario Source", scenario_sources, horizontal=True)
+if st.button("Save Scenario", disabled=not scenario_name):
+    if scenario_source == "Uploaded Portfolio":
+        # Keep identifying columns, but drop report results that edits would make stale
+        stale_columns = [col for col in portfolio_df.columns if col == "LPS Recommendation" or col.endswith("Coefficient Description")]
+        scenario_df = portfolio_df.drop(columns=stale_columns)
+    else:
+        scenario_df = pd.DataFrame([{col: report_data[col] for col in ["Project Name"] + INPUT_COLUMNS}])
+    st.session_state.scenarios[scenario_name] = compute_scenario(scenario_df)
+    st.success(f"Scenario '{scenario_name}' saved.")
+
+if st.session_state.scenarios:
+    scenario_names = list(st.session_state.scenarios.keys())
+
+    st.markdown("##### Edit Scenario")
+    cols = st.columns(4, vertical_alignment="bottom")
+    with cols[0]:
+        edit_source = st.selectbox("Scenario to Edit", scenario_names, key='edit_source_key')
+    with cols[1]:
+        edit_column = st.selectbox("Input", INPUT_COLUMNS, key='edit_column_key')
+    with cols[2]:
+        # Dimensions match the structure inputs above; coefficients and Ng must stay positive
+        edit_min_value = 1.0 if edit_column in (LENGTH_COLUMN, WIDTH_COLUMN, HEIGHT_COLUMN) else 0.01
+        edit_value = st.number_input("New Value", min_value=edit_min_value, value=1.0, key=f'edit_value_key_{edit_column}')
+    with cols[3]:
+        edit_name = st.text_input("Save As", value=f"{edit_source} ({edit_column} = {edit_value:g})", key='edit_name_key')
+    if st.button("Apply Edit", disabled=not edit_name):
+        st.session_state.scenarios[edit_name] = update_scenario(
+            st.session_state.scenarios[edit_source],
+            {edit_column: edit_value},
+        )
+        st.success(f"Scenario '{edit_name}' saved.")
+        scenario_names = list(st.session_state.scenarios.keys())
+
+    st.markdown("##### Compare Scenarios")
+    cols = st.columns(2)
+    with cols[0]:
+        base_scenario = st.selectbox("Base Scenario", scenario_names, index=0, key='base_scenario_key')
+    with cols[1]:
+        other_names = [name for name in scenario_names if name != base_scenario]
+        compared_scenarios = st.multiselect("Compared Scenarios", other_names, default=other_names)
+    try:
+        comparison_df = compare_scenarios(
+            {name: st.session_state.scenarios[name] for name in [base_scenario] + compared_scenarios},
+            base_scenario,
+        )
+    except ValueError as e:
+        st.error(str(e))
+    else:
+        if comparison_df.empty:
+            st.info("The selected scenarios are identical.")
+        else:
+            st.dataframe(comparison_df)
+            st.download_button(
+                label="Download Scenario Comparison CSV",
+                data=comparison_df.to_csv(index_label="Row").encode('utf-8'),
+                file_name=f"{project_name}_lightning_risk_scenarios_{now}.csv",
+                mime="text/csv"
+            )
+
 st.markdown("---")
 st.markdown("## Detailed Assessment")
 
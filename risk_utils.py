@@ -0,0 +1,256 @@
+import numpy as np
+
+FT_TO_M = 0.3048  # feet to meters
+NG_CONVERSION = 0.386102  # flashes/sq miles/year to flashes/sq km/year
+TOLERABLE_FREQUENCY_FACTOR = 1.5 * 10**-3
+
+# CSV column names shared with the simplified assessment report
+LENGTH_COLUMN = "Length (ft)"
+WIDTH_COLUMN = "Width (ft)"
+HEIGHT_COLUMN = "Height (ft)"
+NG_COLUMN = "Ground Flash Density (flashes/sq miles/year)"
+C_2_COLUMN = "Construction Coefficient"
+C_3_COLUMN = "Contents Coefficient"
+C_4_COLUMN = "Occupancy Coefficient"
+C_5_COLUMN = "Consequence Coefficient"
+C_D_COLUMN = "Location Coefficient"
+
+
+def collection_area(l, w, h):
+    """Calculate the equivalent collection area of a structure.
+    Args:
+        l (float or array-like): Length of the structure in feet.
+        w (float or array-like): Width of the structure in feet.
+        h (float or array-like): Height of the structure in feet.
+    Returns:
+        float or numpy.ndarray: Collection area (A_D) in m².
+    """
+    l_m = np.asarray(l, dtype=float) * FT_TO_M
+    w_m = np.asarray(w, dtype=float) * FT_TO_M
+    h_m = np.asarray(h, dtype=float) * FT_TO_M
+    return l_m * w_m + 6 * h_m * (l_m + w_m) + 9 * np.pi * h_m * h_m
+
+
+def threat_from_area(Ng, A_D, C_D):
+    """Calculate the expected annual threat occurrence (N_D) from a collection area.
+    Args:
+        Ng (float or array-like): Ground flash density in flashes/sq miles/year.
+        A_D (float or array-like): Collection area in m².
+        C_D (float or array-like): Location coefficient.
+    Returns:
+        float or numpy.ndarray: Expected annual threat occurrence in flashes/year.
+    """
+    Ng_m2 = np.asarray(Ng, dtype=float) * NG_CONVERSION
+    return Ng_m2 * np.asarray(A_D, dtype=float) * np.asarray(C_D, dtype=float) * 10**-6
+
+
+def expected_annual_threat(l, w, h, Ng, C_D):
+    """Calculate the expected annual threat occurrence (N_D).
+    Args:
+        l (float or array-like): Length of the structure in feet.
+        w (float or array-like): Width of the structure in feet.
+        h (float or array-like): Height of the structure in feet.
+        Ng (float or array-like): Ground flash density in flashes/sq miles/year.
+        C_D (float or array-like): Location coefficient.
+    Returns:
+        float or numpy.ndarray: Expected annual threat occurrence in flashes/year.
+    """
+    return threat_from_area(Ng, collection_area(l, w, h), C_D)
+
+
+def combined_coefficient(C_2, C_3, C_4, C_5):
+    """Calculate the combined coefficient C = C_2 × C_3 × C_4 × C_5.
+    Args:
+        C_2 (float or array-like): Construction coefficient.
+        C_3 (float or array-like): Contents coefficient.
+        C_4 (float or array-like): Occupancy coefficient.
+        C_5 (float or array-like): Consequence coefficient.
+    Returns:
+        float or numpy.ndarray: Combined coefficient.
+    """
+    return (np.asarray(C_2, dtype=float) * np.asarray(C_3, dtype=float)
+            * np.asarray(C_4, dtype=float) * np.asarray(C_5, dtype=float))
+
+
+def tolerable_frequency_from_coefficient(C):
+    """Calculate the tolerable lightning frequency (N_c) from the combined coefficient.
+    Args:
+        C (float or array-like): Combined coefficient.
+    Returns:
+        float or numpy.ndarray: Tolerable lightning frequency in flashes/year.
+    """
+    return TOLERABLE_FREQUENCY_FACTOR / np.asarray(C, dtype=float)
+
+
+def tolerable_frequency(C_2, C_3, C_4, C_5):
+    """Calculate the tolerable lightning frequency (N_c).
+    Args:
+        C_2 (float or array-like): Construction coefficient.
+        C_3 (float or array-like): Contents coefficient.
+        C_4 (float or array-like): Occupancy coefficient.
+        C_5 (float or array-like): Consequence coefficient.
+    Returns:
+        float or numpy.ndarray: Tolerable lightning frequency in flashes/year.
+    """
+    return tolerable_frequency_from_coefficient(combined_coefficient(C_2, C_3, C_4, C_5))
+
+
+def max_collection_area(Ng, C_D, C_2, C_3, C_4, C_5):
+    """Calculate the largest collection area for which an LPS is optional.
+    Args:
+        Ng (float or array-like): Ground flash density in flashes/sq miles/year.
+        C_D (float or array-like): Location coefficient.
+        C_2, C_3, C_4, C_5 (float or array-like): Construction, contents,
+            occupancy and consequence coefficients.
+    Returns:
+        float or numpy.ndarray: Maximum collection area in m² where N_D = N_c.
+    """
+    N_c = tolerable_frequency(C_2, C_3, C_4, C_5)
+    return N_c / threat_from_area(Ng, 1.0, C_D)
+
+
+def max_height(l, w, Ng, C_D, C_2, C_3, C_4, C_5):
+    """Calculate the maximum structure height for which an LPS is optional.
+
+    The collection area is quadratic in height, so N_D = N_c is solved
+    directly with the positive root of 9πh² + 6(l + w)h + (lw - A_max) = 0.
+    Args:
+        l (float or array-like): Length of the structure in feet.
+        w (float or array-like): Width of the structure in feet.
+        Ng (float or array-like): Ground flash density in flashes/sq miles/year.
+        C_D (float or array-like): Location coefficient.
+        C_2, C_3, C_4, C_5 (float or array-like): Construction, contents,
+            occupancy and consequence coefficients.
+    Returns:
+        float or numpy.ndarray: Maximum height in feet, NaN where the footprint
+            alone already exceeds the tolerable collection area.
+    """
+    l_m = np.asarray(l, dtype=float) * FT_TO_M
+    w_m = np.asarray(w, dtype=float) * FT_TO_M
+    A_max = max_collection_area(Ng, C_D, C_2, C_3, C_4, C_5)
+    a = 9 * np.pi
+    b = 6 * (l_m + w_m)
+    c = l_m * w_m - A_max
+    with np.errstate(invalid="ignore"):
+        h_m = (-b + np.sqrt(b * b - 4 * a * c)) / (2 * a)
+    h_m = np.where(c <= 0, h_m, np.nan)
+    return h_m / FT_TO_M
+
+
+def max_length(w, h, Ng, C_D, C_2, C_3, C_4, C_5):
+    """Calculate the maximum structure length for which an LPS is optional.
+
+    The collection area is linear in length for a fixed width and height,
+    so l = (A_max - 6hw - 9πh²) / (w + 6h).
+    Args:
+        w (float or array-like): Width of the structure in feet.
+        h (float or array-like): Height of the structure in feet.
+        Ng (float or array-like): Ground flash density in flashes/sq miles/year.
+        C_D (float or array-like): Location coefficient.
+        C_2, C_3, C_4, C_5 (float or array-like): Construction, contents,
+            occupancy and consequence coefficients.
+    Returns:
+        float or numpy.ndarray: Maximum length in feet, NaN where no positive
+            length keeps an LPS optional.
+    """
+    w_m = np.asarray(w, dtype=float) * FT_TO_M
+    h_m = np.asarray(h, dtype=float) * FT_TO_M
+    A_max = max_collection_area(Ng, C_D, C_2, C_3, C_4, C_5)
+    l_m = (A_max - 6 * h_m * w_m - 9 * np.pi * h_m * h_m) / (w_m + 6 * h_m)
+    l_m = np.where(l_m > 0, l_m, np.nan)
+    return l_m / FT_TO_M
+
+
+def max_footprint(l, w, h, Ng, C_D, C_2, C_3, C_4, C_5):
+    """Calculate the maximum footprint area for which an LPS is optional.
+
+    Length and width are scaled together by a factor k, so the collection
+    area is quadratic in k and N_D = N_c is solved with the positive root of
+    lw·k² + 6h(l + w)·k + (9πh² - A_max) = 0.
+    Args:
+        l (float or array-like): Length of the structure in feet.
+        w (float or array-like): Width of the structure in feet.
+        h (float or array-like): Height of the structure in feet.
+        Ng (float or array-like): Ground flash density in flashes/sq miles/year.
+        C_D (float or array-like): Location coefficient.
+        C_2, C_3, C_4, C_5 (float or array-like): Construction, contents,
+            occupancy and consequence coefficients.
+    Returns:
+        float or numpy.ndarray: Maximum footprint (k²·l·w) in ft², NaN where
+            the height alone already exceeds the tolerable collection area.
+    """
+    l_m = np.asarray(l, dtype=float) * FT_TO_M
+    w_m = np.asarray(w, dtype=float) * FT_TO_M
+    h_m = np.asarray(h, dtype=float) * FT_TO_M
+    A_max = max_collection_area(Ng, C_D, C_2, C_3, C_4, C_5)
+    a = l_m * w_m
+    b = 6 * h_m * (l_m + w_m)
+    c = 9 * np.pi * h_m * h_m - A_max
+    with np.errstate(invalid="ignore"):
+        k = (-b + np.sqrt(b * b - 4 * a * c)) / (2 * a)
+    k = np.where(c <= 0, k, np.nan)
+    return k * k * np.asarray(l, dtype=float) * np.asarray(w, dtype=float)
+
+
+def max_coefficient_product(l, w, h, Ng, C_D):
+    """Calculate the largest combined coefficient C = C_2 × C_3 × C_4 × C_5
+    for which an LPS is optional.
+    Args:
+        l (float or array-like): Length of the structure in feet.
+        w (float or array-like): Width of the structure in feet.
+        h (float or array-like): Height of the structure in feet.
+        Ng (float or array-like): Ground flash density in flashes/sq miles/year.
+        C_D (float or array-like): Location coefficient.
+    Returns:
+        float or numpy.ndarray: Maximum combined coefficient.
+    """
+    return TOLERABLE_FREQUENCY_FACTOR / expected_annual_threat(l, w, h, Ng, C_D)
+
+
+def invalid_structures(df):
+    """Flag structures whose inputs cannot be assessed.
+
+    Dimensions must be at least 1 ft, matching the structure inputs, and the
+    ground flash density and coefficients must be positive.
+    Args:
+        df (pandas.DataFrame): Structures with numeric simplified assessment
+            report columns for dimensions, ground flash density and coefficients.
+    Returns:
+        pandas.Series: True for rows with missing, too small or non-positive values.
+    """
+    dimensions = df[[LENGTH_COLUMN, WIDTH_COLUMN, HEIGHT_COLUMN]]
+    factors = df[[NG_COLUMN, C_2_COLUMN, C_3_COLUMN, C_4_COLUMN, C_5_COLUMN, C_D_COLUMN]]
+    # NaN fails both comparisons, so blank cells are flagged too
+    return ~(dimensions >= 1).all(axis=1) | ~(factors > 0).all(axis=1)
+
+
+def solve_lps_limits(df):
+    """Solve the LPS-optional limits for every structure in a portfolio.
+    Args:
+        df (pandas.DataFrame): Structures with the simplified assessment
+            report columns for dimensions, ground flash density and coefficients.
+    Returns:
+        pandas.DataFrame: Copy of df with maximum height, maximum length,
+            maximum footprint, maximum combined coefficient and headroom
+            columns added.
+    """
+    l = df[LENGTH_COLUMN].to_numpy(dtype=float)
+    w = df[WIDTH_COLUMN].to_numpy(dtype=float)
+    h = df[HEIGHT_COLUMN].to_numpy(dtype=float)
+    Ng = df[NG_COLUMN].to_numpy(dtype=float)
+    C_D = df[C_D_COLUMN].to_numpy(dtype=float)
+    C_2 = df[C_2_COLUMN].to_numpy(dtype=float)
+    C_3 = df[C_3_COLUMN].to_numpy(dtype=float)
+    C_4 = df[C_4_COLUMN].to_numpy(dtype=float)
+    C_5 = df[C_5_COLUMN].to_numpy(dtype=float)
+
+    result = df.copy()
+    result["Maximum Height (ft)"] = max_height(l, w, Ng, C_D, C_2, C_3, C_4, C_5)
+    result["Height Headroom (ft)"] = result["Maximum Height (ft)"] - h
+    result["Maximum Length (ft)"] = max_length(w, h, Ng, C_D, C_2, C_3, C_4, C_5)
+    result["Length Headroom (ft)"] = result["Maximum Length (ft)"] - l
+    result["Maximum Footprint (ft²)"] = max_footprint(l, w, h, Ng, C_D, C_2, C_3, C_4, C_5)
+    result["Footprint Headroom (ft²)"] = result["Maximum Footprint (ft²)"] - l * w
+    result["Maximum Combined Coefficient"] = max_coefficient_product(l, w, h, Ng, C_D)
+    result["Combined Coefficient Headroom"] = result["Maximum Combined Coefficient"] - combined_coefficient(C_2, C_3, C_4, C_5)
+    return result
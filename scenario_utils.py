@@ -0,0 +1,193 @@
+import numpy as np
+import pandas as pd
+from risk_utils import (
+    collection_area,
+    threat_from_area,
+    combined_coefficient,
+    tolerable_frequency_from_coefficient,
+    LENGTH_COLUMN,
+    WIDTH_COLUMN,
+    HEIGHT_COLUMN,
+    NG_COLUMN,
+    C_2_COLUMN,
+    C_3_COLUMN,
+    C_4_COLUMN,
+    C_5_COLUMN,
+    C_D_COLUMN,
+)
+
+AREA_COLUMN = "Collection Area (m²)"
+N_D_COLUMN = "Expected Annual Threat Occurrence (flashes/year)"
+C_COLUMN = "Combined Coefficient"
+N_C_COLUMN = "Tolerable Lightning Frequency (flashes/year)"
+LPS_COLUMN = "LPS Optional"
+
+INPUT_COLUMNS = [
+    LENGTH_COLUMN,
+    WIDTH_COLUMN,
+    HEIGHT_COLUMN,
+    NG_COLUMN,
+    C_2_COLUMN,
+    C_3_COLUMN,
+    C_4_COLUMN,
+    C_5_COLUMN,
+    C_D_COLUMN,
+]
+
+# Dependency graph of the simplified assessment, in calculation order:
+# derived column -> (input columns, function of those columns)
+CALCULATION_GRAPH = {
+    AREA_COLUMN: (
+        (LENGTH_COLUMN, WIDTH_COLUMN, HEIGHT_COLUMN),
+        collection_area,
+    ),
+    N_D_COLUMN: (
+        (NG_COLUMN, AREA_COLUMN, C_D_COLUMN),
+        threat_from_area,
+    ),
+    C_COLUMN: (
+        (C_2_COLUMN, C_3_COLUMN, C_4_COLUMN, C_5_COLUMN),
+        combined_coefficient,
+    ),
+    N_C_COLUMN: (
+        (C_COLUMN,),
+        tolerable_frequency_from_coefficient,
+    ),
+    LPS_COLUMN: (
+        (N_D_COLUMN, N_C_COLUMN),
+        lambda N_D, N_c: N_D <= N_c,
+    ),
+}
+
+RESULT_COLUMNS = list(CALCULATION_GRAPH)
+
+
+def affected_columns(changed_columns):
+    """Find the derived columns that depend on the changed columns.
+    Args:
+        changed_columns (iterable of str): Names of the edited columns.
+    Returns:
+        list of str: Derived columns to recompute, in calculation order.
+    """
+    dirty = set(changed_columns)
+    affected = []
+    for column, (inputs, _) in CALCULATION_GRAPH.items():
+        if dirty.intersection(inputs):
+            dirty.add(column)
+            affected.append(column)
+    return affected
+
+
+def _recompute(df, columns, positions=None):
+    """Recompute the given derived columns of df in place.
+    Args:
+        df (pandas.DataFrame): Scenario to update.
+        columns (list of str): Derived columns, in calculation order.
+        positions (numpy.ndarray, optional): Row positions to recompute; all
+            rows if None.
+    """
+    values = {}
+    for column in columns:
+        inputs, func = CALCULATION_GRAPH[column]
+        args = []
+        for name in inputs:
+            if name not in values:
+                array = df[name].to_numpy(dtype=float)
+                values[name] = array if positions is None else array[positions]
+            args.append(values[name])
+        values[column] = func(*args)
+        if positions is None:
+            df[column] = values[column]
+        else:
+            array = df[column].to_numpy(copy=True)
+            array[positions] = values[column]
+            df[column] = array
+
+
+def compute_scenario(df):
+    """Run the full simplified assessment for every row of a scenario.
+    Args:
+        df (pandas.DataFrame): Structures with the input columns.
+    Returns:
+        pandas.DataFrame: Copy of df with float input columns and all derived
+            columns added.
+    """
+    result = df.copy()
+    # Float inputs let later row-subset edits assign non-integer values
+    result[INPUT_COLUMNS] = result[INPUT_COLUMNS].astype(float)
+    _recompute(result, RESULT_COLUMNS)
+    return result
+
+
+def update_scenario(df, changes, rows=None):
+    """Edit inputs of a computed scenario and recompute only what they affect.
+    Args:
+        df (pandas.DataFrame): Scenario returned by compute_scenario.
+        changes (dict): Input column name -> new value (scalar or per-row array).
+        rows (array-like, optional): Index labels to edit; all rows if None.
+    Returns:
+        pandas.DataFrame: Updated copy of df.
+    """
+    unknown = set(changes) - set(INPUT_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown input columns: {sorted(unknown)}")
+    positions = None
+    if rows is not None:
+        positions = df.index.get_indexer(rows)
+        if (positions < 0).any():
+            raise KeyError("Rows not found in scenario.")
+    # Shallow copy: every edited or recomputed column is replaced with a new
+    # array, so the source scenario is never modified
+    result = df.copy(deep=False)
+    for column, value in changes.items():
+        if positions is None:
+            result[column] = np.broadcast_to(np.asarray(value, dtype=float), len(result)).copy()
+        else:
+            array = result[column].to_numpy(dtype=float, copy=True)
+            array[positions] = value
+            result[column] = array
+    _recompute(result, affected_columns(changes), positions)
+    return result
+
+
+def compare_scenarios(scenarios, base_name):
+    """Build a side-by-side comparison of named scenarios of the same structures.
+
+    Rows are matched by index label, and missing values compare equal.
+    Args:
+        scenarios (dict): Scenario name -> computed scenario DataFrame.
+        base_name (str): Name of the reference scenario in scenarios.
+    Returns:
+        pandas.DataFrame: The base scenario's identifying columns, then for each
+            input and derived column that differs in any scenario, the base
+            value, each scenario's value and its difference from the base.
+            Empty if nothing differs.
+    """
+    base = scenarios[base_name]
+    others = {}
+    for name, other in scenarios.items():
+        if name == base_name:
+            continue
+        if len(base) != len(other) or not base.index.isin(other.index).all():
+            raise ValueError(f"Scenario '{name}' does not contain the same structures as '{base_name}'.")
+        others[name] = other.reindex(base.index)
+    comparison = {}
+    for column in INPUT_COLUMNS + RESULT_COLUMNS:
+        base_values = base[column].to_numpy()
+        other_values = {name: other[column].to_numpy() for name, other in others.items()}
+        if column == LPS_COLUMN:
+            unchanged = all(np.array_equal(base_values, values) for values in other_values.values())
+        else:
+            unchanged = all(np.array_equal(base_values, values, equal_nan=True) for values in other_values.values())
+        if unchanged:
+            continue
+        comparison[f"{column} - {base_name}"] = base_values
+        for name, values in other_values.items():
+            comparison[f"{column} - {name}"] = values
+            if column != LPS_COLUMN:
+                comparison[f"{column} - Delta ({name})"] = values.astype(float) - base_values.astype(float)
+    if not comparison:
+        return pd.DataFrame(index=base.index)
+    # Carry identifying columns such as the project name ahead of the deltas
+    identifiers = [column for column in base.columns if column not in INPUT_COLUMNS + RESULT_COLUMNS]
+    return pd.concat([base[identifiers], pd.DataFrame(comparison, index=base.index)], axis=1)
@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+from risk_utils import (
+    collection_area,
+    expected_annual_threat,
+    tolerable_frequency,
+    max_height,
+    max_length,
+    max_footprint,
+    max_coefficient_product,
+    solve_lps_limits,
+    invalid_structures,
+    LENGTH_COLUMN,
+    WIDTH_COLUMN,
+    HEIGHT_COLUMN,
+    NG_COLUMN,
+    C_2_COLUMN,
+    C_3_COLUMN,
+    C_4_COLUMN,
+    C_5_COLUMN,
+    C_D_COLUMN,
+)
+
+rng = np.random.default_rng(0)
+n = 1000
+l = rng.uniform(10, 500, n)
+w = rng.uniform(10, 500, n)
+h = rng.uniform(5, 200, n)
+Ng = rng.choice([2, 6, 10, 14, 18, 22, 26, 28], n)
+C_D = rng.choice([0.25, 0.5, 1.0, 2.0], n)
+C_2 = rng.choice([0.5, 1.0, 2.0, 2.5, 3.0], n)
+C_3 = rng.choice([0.5, 1.0, 2.0, 3.0, 4.0], n)
+C_4 = rng.choice([0.5, 1.0, 3.0], n)
+C_5 = rng.choice([1.0, 5.0, 10.0], n)
+
+
+def test_collection_area_matches_scalar_formula():
+    l_m, w_m, h_m = 20 * 0.3048, 10 * 0.3048, 10 * 0.3048
+    expected = l_m * w_m + 6 * h_m * (l_m + w_m) + 9 * np.pi * h_m * h_m
+    assert np.isclose(collection_area(20, 10, 10), expected)
+
+
+def test_max_height_reaches_threshold():
+    h_max = max_height(l, w, Ng, C_D, C_2, C_3, C_4, C_5)
+    feasible = ~np.isnan(h_max)
+    assert feasible.any()
+    N_D = expected_annual_threat(l[feasible], w[feasible], h_max[feasible], Ng[feasible], C_D[feasible])
+    N_c = tolerable_frequency(C_2[feasible], C_3[feasible], C_4[feasible], C_5[feasible])
+    assert np.allclose(N_D, N_c)
+
+
+def test_max_height_is_nan_when_footprint_exceeds_limit():
+    # Footprint alone (N_D at h = 0) exceeds the tolerable frequency
+    assert np.isnan(max_height(5000, 5000, 28, 2.0, 3.0, 4.0, 3.0, 10.0))
+    h_max = max_height(l, w, Ng, C_D, C_2, C_3, C_4, C_5)
+    infeasible = expected_annual_threat(l, w, 0, Ng, C_D) > tolerable_frequency(C_2, C_3, C_4, C_5)
+    assert np.array_equal(np.isnan(h_max), infeasible)
+
+
+def test_max_length_reaches_threshold():
+    l_max = max_length(w, h, Ng, C_D, C_2, C_3, C_4, C_5)
+    feasible = ~np.isnan(l_max)
+    assert feasible.any()
+    N_D = expected_annual_threat(l_max[feasible], w[feasible], h[feasible], Ng[feasible], C_D[feasible])
+    N_c = tolerable_frequency(C_2[feasible], C_3[feasible], C_4[feasible], C_5[feasible])
+    assert np.allclose(N_D, N_c)
+
+
+def test_max_footprint_reaches_threshold():
+    footprint = max_footprint(l, w, h, Ng, C_D, C_2, C_3, C_4, C_5)
+    feasible = ~np.isnan(footprint)
+    assert feasible.any()
+    k = np.sqrt(footprint[feasible] / (l[feasible] * w[feasible]))
+    N_D = expected_annual_threat(k * l[feasible], k * w[feasible], h[feasible], Ng[feasible], C_D[feasible])
+    N_c = tolerable_frequency(C_2[feasible], C_3[feasible], C_4[feasible], C_5[feasible])
+    assert np.allclose(N_D, N_c)
+    infeasible = expected_annual_threat(0, 0, h, Ng, C_D) > tolerable_frequency(C_2, C_3, C_4, C_5)
+    assert np.array_equal(~feasible, infeasible)
+
+
+def test_max_coefficient_product_reaches_threshold():
+    C_max = max_coefficient_product(l, w, h, Ng, C_D)
+    assert np.allclose(tolerable_frequency(C_max, 1, 1, 1), expected_annual_threat(l, w, h, Ng, C_D))
+
+
+def test_solve_lps_limits_headroom_sign_matches_recommendation():
+    df = pd.DataFrame({
+        LENGTH_COLUMN: l,
+        WIDTH_COLUMN: w,
+        HEIGHT_COLUMN: h,
+        NG_COLUMN: Ng,
+        C_D_COLUMN: C_D,
+        C_2_COLUMN: C_2,
+        C_3_COLUMN: C_3,
+        C_4_COLUMN: C_4,
+        C_5_COLUMN: C_5,
+    })
+    result = solve_lps_limits(df)
+    lps_optional = expected_annual_threat(l, w, h, Ng, C_D) <= tolerable_frequency(C_2, C_3, C_4, C_5)
+    assert np.array_equal(result["Combined Coefficient Headroom"].to_numpy() >= 0, lps_optional)
+    assert np.array_equal(result["Height Headroom (ft)"].to_numpy() >= 0, lps_optional)
+
+
+def test_invalid_structures_flags_unassessable_rows():
+    df = pd.DataFrame({
+        LENGTH_COLUMN: [20.0, 0.0, -5.0, 20.0, 20.0, 20.0, 1.0],
+        WIDTH_COLUMN: [10.0, 10.0, 10.0, 10.0, 10.0, 10.0, 1.0],
+        HEIGHT_COLUMN: [10.0, 10.0, 10.0, np.nan, 10.0, 10.0, 1.0],
+        NG_COLUMN: [2.0, 2.0, 2.0, 2.0, 2.0, 0.0, 2.0],
+        C_D_COLUMN: [0.25, 0.25, 0.25, 0.25, 0.25, 0.25, 0.25],
+        C_2_COLUMN: [1.0, 1.0, 1.0, 1.0, 0.0, 1.0, 0.5],
+        C_3_COLUMN: [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.5],
+        C_4_COLUMN: [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.5],
+        C_5_COLUMN: [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0],
+    })
+    assert invalid_structures(df).tolist() == [False, True, True, True, True, True, False]
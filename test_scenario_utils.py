@@ -0,0 +1,187 @@
+import timeit
+import numpy as np
+import pandas as pd
+import pytest
+import scenario_utils
+from scenario_utils import (
+    affected_columns,
+    compute_scenario,
+    update_scenario,
+    compare_scenarios,
+    INPUT_COLUMNS,
+    AREA_COLUMN,
+    N_D_COLUMN,
+    C_COLUMN,
+    N_C_COLUMN,
+    LPS_COLUMN,
+)
+from risk_utils import (
+    LENGTH_COLUMN,
+    WIDTH_COLUMN,
+    HEIGHT_COLUMN,
+    NG_COLUMN,
+    C_2_COLUMN,
+    C_3_COLUMN,
+    C_4_COLUMN,
+    C_5_COLUMN,
+    C_D_COLUMN,
+)
+
+
+def make_portfolio(n=200):
+    rng = np.random.default_rng(1)
+    return pd.DataFrame({
+        LENGTH_COLUMN: rng.integers(10, 500, n),
+        WIDTH_COLUMN: rng.integers(10, 500, n),
+        HEIGHT_COLUMN: rng.integers(5, 200, n),
+        NG_COLUMN: rng.choice([2, 6, 10, 14, 18, 22, 26, 28], n),
+        C_2_COLUMN: rng.choice([0.5, 1.0, 2.0, 2.5, 3.0], n),
+        C_3_COLUMN: rng.choice([0.5, 1.0, 2.0, 3.0, 4.0], n),
+        C_4_COLUMN: rng.choice([0.5, 1.0, 3.0], n),
+        C_5_COLUMN: rng.choice([1.0, 5.0, 10.0], n),
+        C_D_COLUMN: rng.choice([0.25, 0.5, 1.0, 2.0], n),
+    })
+
+
+def test_affected_columns_follow_calculation_order():
+    assert affected_columns([LENGTH_COLUMN]) == [AREA_COLUMN, N_D_COLUMN, LPS_COLUMN]
+    assert affected_columns([C_D_COLUMN]) == [N_D_COLUMN, LPS_COLUMN]
+    assert affected_columns([NG_COLUMN]) == [N_D_COLUMN, LPS_COLUMN]
+    assert affected_columns([C_2_COLUMN]) == [C_COLUMN, N_C_COLUMN, LPS_COLUMN]
+    assert affected_columns([HEIGHT_COLUMN, C_4_COLUMN]) == [AREA_COLUMN, N_D_COLUMN, C_COLUMN, N_C_COLUMN, LPS_COLUMN]
+    assert affected_columns([]) == []
+
+
+@pytest.mark.parametrize("changes", [
+    {LENGTH_COLUMN: 25.5},
+    {C_D_COLUMN: 2.0},
+    {C_2_COLUMN: 3.0, HEIGHT_COLUMN: 120.5},
+])
+@pytest.mark.parametrize("rows", [None, [0, 5, 17, 199]])
+def test_update_scenario_matches_full_recompute(changes, rows):
+    portfolio = make_portfolio()
+    scenario = compute_scenario(portfolio)
+    updated = update_scenario(scenario, changes, rows)
+
+    edited = portfolio[INPUT_COLUMNS].astype(float)
+    for column, value in changes.items():
+        if rows is None:
+            edited[column] = value
+        else:
+            edited.loc[rows, column] = value
+    expected = compute_scenario(edited)
+    pd.testing.assert_frame_equal(updated, expected)
+
+
+def spy_on_graph(monkeypatch):
+    calls = {}
+    for column, (inputs, func) in list(scenario_utils.CALCULATION_GRAPH.items()):
+        def spy(*args, column=column, func=func):
+            calls.setdefault(column, []).append(args)
+            return func(*args)
+        monkeypatch.setitem(scenario_utils.CALCULATION_GRAPH, column, (inputs, spy))
+    return calls
+
+
+def test_update_scenario_skips_unaffected_columns(monkeypatch):
+    scenario = compute_scenario(make_portfolio())
+    calls = spy_on_graph(monkeypatch)
+    update_scenario(scenario, {C_2_COLUMN: 3.0})
+    assert set(calls) == {C_COLUMN, N_C_COLUMN, LPS_COLUMN}
+    assert AREA_COLUMN not in calls
+    assert N_D_COLUMN not in calls
+
+
+def test_update_scenario_recomputes_only_selected_rows(monkeypatch):
+    scenario = compute_scenario(make_portfolio())
+    rows = [3, 50, 120]
+    calls = spy_on_graph(monkeypatch)
+    update_scenario(scenario, {HEIGHT_COLUMN: 40.0}, rows)
+    assert set(calls) == {AREA_COLUMN, N_D_COLUMN, LPS_COLUMN}
+    (l, w, h), = calls[AREA_COLUMN]
+    assert np.array_equal(l, scenario.loc[rows, LENGTH_COLUMN].to_numpy())
+    assert np.array_equal(w, scenario.loc[rows, WIDTH_COLUMN].to_numpy())
+    assert np.array_equal(h, np.full(len(rows), 40.0))
+    for column in calls:
+        for args in calls[column]:
+            assert all(len(arg) == len(rows) for arg in args)
+
+
+def test_update_scenario_leaves_source_unchanged():
+    scenario = compute_scenario(make_portfolio())
+    original = scenario.copy()
+    update_scenario(scenario, {LENGTH_COLUMN: 25.5, C_2_COLUMN: 3.0})
+    update_scenario(scenario, {LENGTH_COLUMN: 25.5, C_2_COLUMN: 3.0}, rows=[0, 1])
+    pd.testing.assert_frame_equal(scenario, original)
+
+
+def test_update_scenario_is_cheaper_than_full_recompute():
+    portfolio = make_portfolio(100_000)
+    scenario = compute_scenario(portfolio)
+    rows = scenario.index[::10]
+
+    def best_time(func):
+        return min(timeit.repeat(func, number=3, repeat=5))
+
+    full = best_time(lambda: compute_scenario(portfolio))
+    assert best_time(lambda: update_scenario(scenario, {C_2_COLUMN: 2.0})) < full / 2
+    assert best_time(lambda: update_scenario(scenario, {C_2_COLUMN: 2.0}, rows)) < full / 2
+
+
+def test_update_scenario_rejects_derived_columns():
+    scenario = compute_scenario(make_portfolio())
+    with pytest.raises(ValueError):
+        update_scenario(scenario, {AREA_COLUMN: 1.0})
+
+
+def test_compare_scenarios_reports_only_changed_columns():
+    scenario = compute_scenario(make_portfolio())
+    updated = update_scenario(scenario, {C_2_COLUMN: 3.0})
+    comparison = compare_scenarios({"Base": scenario, "Combustible": updated}, "Base")
+    changed = {column.rsplit(" - ", 1)[0] for column in comparison.columns}
+    assert changed <= {C_2_COLUMN, C_COLUMN, N_C_COLUMN, LPS_COLUMN}
+    assert C_2_COLUMN in changed
+    assert np.allclose(
+        comparison[f"{N_C_COLUMN} - Delta (Combustible)"],
+        updated[N_C_COLUMN] - scenario[N_C_COLUMN],
+    )
+    assert compare_scenarios({"Base": scenario}, "Base").empty
+
+
+def test_compare_scenarios_keeps_identifying_columns():
+    portfolio = make_portfolio()
+    portfolio.insert(0, "Project Name", [f"Building {i}" for i in range(len(portfolio))])
+    scenario = compute_scenario(portfolio)
+    updated = update_scenario(scenario, {C_D_COLUMN: 1.5}, rows=[7])
+    comparison = compare_scenarios({"Base": scenario, "Scenario": updated}, "Base")
+    assert comparison.columns[0] == "Project Name"
+    assert comparison.loc[7, "Project Name"] == "Building 7"
+
+
+def test_compare_scenarios_treats_missing_values_as_equal():
+    portfolio = make_portfolio()
+    portfolio[HEIGHT_COLUMN] = portfolio[HEIGHT_COLUMN].astype(float)
+    portfolio.loc[4, HEIGHT_COLUMN] = np.nan
+    scenario = compute_scenario(portfolio)
+    assert compare_scenarios({"Base": scenario, "Copy": scenario.copy()}, "Base").empty
+
+
+def test_compare_scenarios_aligns_rows_by_index():
+    scenario = compute_scenario(make_portfolio())
+    shuffled = scenario.sample(frac=1, random_state=0)
+    assert compare_scenarios({"Base": scenario, "Shuffled": shuffled}, "Base").empty
+    with pytest.raises(ValueError):
+        compare_scenarios({"Base": scenario, "Shifted": shuffled.set_axis(shuffled.index + 1000)}, "Base")
+
+
+def test_compare_scenarios_shows_every_variant_against_base():
+    scenario = compute_scenario(make_portfolio())
+    hilltop = update_scenario(scenario, {C_D_COLUMN: 2.0})
+    evacuation = update_scenario(scenario, {C_4_COLUMN: 3.0})
+    comparison = compare_scenarios({"Base": scenario, "Hilltop": hilltop, "Evacuation": evacuation}, "Base")
+    # A column that changes in one variant is shown for every variant
+    for column in (C_D_COLUMN, C_4_COLUMN, N_D_COLUMN, N_C_COLUMN):
+        for name in ("Base", "Hilltop", "Evacuation"):
+            assert f"{column} - {name}" in comparison
+    assert np.allclose(comparison[f"{C_D_COLUMN} - Delta (Evacuation)"], 0)
+    assert np.allclose(comparison[f"{N_D_COLUMN} - Delta (Hilltop)"], hilltop[N_D_COLUMN] - scenario[N_D_COLUMN])